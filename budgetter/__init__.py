@@ -1,6 +1,7 @@
 from collections import defaultdict
 import csv
 import datetime
+import os
 import click
 
 from budgetter.account import Account
@@ -15,8 +16,14 @@ from budgetter.parse import (
     parse_income,
     _parse_file_as_model,
 )
+from budgetter.ledger import Ledger
+from budgetter.columnar import ColumnarForecast, is_columnar, write_columnar
+from budgetter.incremental import IncrementalForecast, Source, digest_row
+from budgetter.report import BalancePeriod, Granularity, resample_balances
 from budgetter.transaction import Transaction
 
+ONE_DAY = datetime.timedelta(days=1)
+
 
 @click.group()
 def main():
@@ -32,7 +39,7 @@ def main():
         dir_okay=False,
         readable=True,
     ),
-    help="File with forecasted transactions",
+    help="File with forecasted transactions, as CSV or binary columns",
 )
 @click.option(
     "-o",
@@ -43,25 +50,144 @@ def main():
         writable=True,
     ),
     default="output.csv",
-    help=("Output file path (default: %(default)s)"),
+    help=(
+        "Output file path, suffixed with the granularity when more than one "
+        "is requested (default: %(default)s)"
+    ),
+)
+@click.option(
+    "-g",
+    "--granularity",
+    type=click.Choice([g.value for g in Granularity]),
+    multiple=True,
+    default=[Granularity.DAY.value],
+    help="Period to aggregate balances by, may be given more than once",
+)
+@click.option(
+    "--start",
+    type=click.DateTime(formats=["%Y-%m-%d"]),
+    help="First day to report (default: first transaction)",
+)
+@click.option(
+    "--end",
+    type=click.DateTime(formats=["%Y-%m-%d"]),
+    help="Last day to report (default: last transaction)",
+)
+@click.option(
+    "--ledger",
+    type=click.Path(
+        exists=True,
+        dir_okay=False,
+        readable=True,
+    ),
+    help="SQLite ledger to read forecasted transactions from instead of a file",
+)
+@click.option(
+    "-a",
+    "--account",
+    default="checking",
+    help="Account to report on when reading a ledger (default: %(default)s)",
 )
 def balance_sheet(
     forecast: str,
     output: str,
+    granularity: tuple[str, ...],
+    start: datetime.datetime | None,
+    end: datetime.datetime | None,
+    ledger: str | None,
+    account: str,
 ):
-    checking = Account(
-        transactions=_parse_file_as_model(forecast, Transaction),
-        name="Checking",
+    granularities = [Granularity(g) for g in granularity]
+    periods = {g: [] for g in granularities}
+    if ledger:
+        with Ledger(ledger, read_only=True) as book:
+            window = _report_window(start, end, book.date_range(account, forecast=True))
+            if window:
+                start, end = window
+                periods = resample_balances(
+                    book.transactions(account, start, end, forecast=True),
+                    granularities,
+                    start,
+                    end,
+                    book.balance_before(account, start, forecast=True),
+                )
+    elif not forecast:
+        raise click.UsageError("One of --forecast or --ledger is required")
+    elif is_columnar(forecast):
+        columns = ColumnarForecast.open(forecast)
+        bounds = (
+            (columns.when[0].item(), columns.when[-1].item()) if len(columns) else None
+        )
+        window = _report_window(start, end, bounds)
+        if window:
+            start, end = window
+            opening = int(columns.between(end=start - ONE_DAY).amount_cents.sum())
+            periods = resample_balances(
+                columns.between(start, end).transactions(),
+                granularities,
+                start,
+                end,
+                opening / 100,
+            )
+    else:
+        checking = Account(
+            transactions=_parse_file_as_model(forecast, Transaction),
+            name="Checking",
+        )
+        transactions = checking.sorted_transactions
+        bounds = None
+        if transactions:
+            bounds = (transactions[0].when.date(), transactions[-1].when.date())
+        window = _report_window(start, end, bounds)
+        if window:
+            start, end = window
+            periods = resample_balances(transactions, granularities, start, end)
+    _write_balance_sheet(output, periods)
+
+
+def _report_window(
+    start: datetime.datetime | None,
+    end: datetime.datetime | None,
+    bounds: tuple[datetime.date, datetime.date] | None,
+) -> tuple[datetime.date, datetime.date] | None:
+    """Resolve the reporting window, defaulting to the transactions' range."""
+    if start and end and start > end:
+        raise click.UsageError(f"--start {start.date()} is after --end {end.date()}")
+    if bounds is None:
+        return None
+    if start and not end and start.date() > bounds[1]:
+        raise click.UsageError(
+            f"--start {start.date()} is after the last transaction ({bounds[1]}), "
+            "pass --end to extend the report"
+        )
+    if end and not start and end.date() < bounds[0]:
+        raise click.UsageError(
+            f"--end {end.date()} is before the first transaction ({bounds[0]}), "
+            "pass --start to extend the report"
+        )
+    return (
+        start.date() if start else bounds[0],
+        end.date() if end else bounds[1],
     )
-    unique_days = set(t.when.date() for t in checking.transactions)
-    unique_days = sorted(unique_days)
-    with open(output, "w", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=["date", "balance"])
-        writer.writeheader()
 
-        for day in unique_days:
-            balance = checking.balance_on_day(day)
-            writer.writerow({"date": day, "balance": f"{balance:.2f}"})
+
+def _write_balance_sheet(output: str, periods: dict[Granularity, list[BalancePeriod]]):
+    for kind, rows in periods.items():
+        path = output
+        if len(periods) > 1:
+            root, ext = os.path.splitext(output)
+            path = f"{root}.{kind.value}{ext}"
+        with open(path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=BalancePeriod.model_fields.keys())
+            writer.writeheader()
+
+            for row in rows:
+                writer.writerow(
+                    {
+                        key: f"{value:.2f}" if isinstance(value, float) else value
+                        for key, value in row.model_dump().items()
+                    }
+                )
 
 
 @main.command()
@@ -74,7 +200,6 @@ def balance_sheet(
         readable=True,
     ),
     help="List of debts",
-    required=True,
 )
 @click.option(
     "-e",
@@ -85,7 +210,6 @@ def balance_sheet(
         readable=True,
     ),
     help="List of expenses",
-    required=True,
 )
 @click.option(
     "-i",
@@ -96,7 +220,6 @@ def balance_sheet(
         readable=True,
     ),
     help="List of incomes",
-    required=True,
 )
 @click.option(
     "-o",
@@ -109,6 +232,34 @@ def balance_sheet(
     default="output.csv",
     help="Output file with all the transactions",
 )
+@click.option(
+    "-s",
+    "--state-dir",
+    type=click.Path(
+        file_okay=False,
+        writable=True,
+    ),
+    help="Directory to keep state in so later runs only recompute changed rows",
+)
+@click.option(
+    "--ledger",
+    type=click.Path(
+        dir_okay=False,
+        writable=True,
+    ),
+    help=(
+        "SQLite ledger to write the budget and forecast to instead of a file, "
+        "the budget is read back from it when no input files are given and "
+        "its initial deposit is set to STARTING_BALANCE"
+    ),
+)
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(["csv", "binary"]),
+    default="csv",
+    help="Write the output as CSV or as memory-mappable columns (default: csv)",
+)
 @click.argument(
     "starting-balance",
     type=click.FloatRange(min=0),
@@ -124,7 +275,84 @@ def forecast(
     starting_balance: float,
     end_date: datetime.date,
     output: str,
+    state_dir: str | None,
+    ledger: str | None,
+    output_format: str,
 ):
+    has_inputs = bool(debts and expenses and incomes)
+    if not has_inputs and (not ledger or debts or expenses or incomes):
+        raise click.UsageError(
+            "--debts, --expenses and --incomes must be given together, "
+            "and can only be left out with --ledger"
+        )
+    if output_format != "csv" and (state_dir or ledger):
+        raise click.UsageError(
+            "--format binary cannot be combined with --state-dir or --ledger"
+        )
+    if state_dir:
+        if ledger:
+            raise click.UsageError("--state-dir cannot be combined with --ledger")
+        forecast_incremental(
+            debts, expenses, incomes, starting_balance, end_date, output, state_dir
+        )
+        return
+
+    if ledger:
+        if not has_inputs:
+            # Reading the budget back needs an existing ledger; don't let
+            # sqlite create an empty one for a misspelled path.
+            click.Path(exists=True, dir_okay=False).convert(
+                ledger, None, click.get_current_context()
+            )
+        with Ledger(ledger) as book:
+            if has_inputs:
+                budget = build_budget(debts, expenses, incomes, starting_balance)
+                book.save_budget(budget)
+            else:
+                budget = book.load_budget()
+                if "checking" not in budget.accounts:
+                    raise click.UsageError(
+                        f"Ledger {ledger} has no checking account, "
+                        "run forecast with --debts, --expenses and --incomes first"
+                    )
+                set_initial_deposit(budget.accounts["checking"], starting_balance)
+                book.save_budget(budget)
+            forecasts = budget.forecast_accounts(end_date)
+            book.save_forecasts(f.account for f in forecasts.values())
+        print("Ending Balance: ", forecasts["checking"].balance)
+        return
+
+    budget = build_budget(debts, expenses, incomes, starting_balance)
+    forecasted = budget.forecast_account("checking", end_date)
+    if output_format == "binary":
+        write_columnar(output, forecasted.sorted_transactions)
+        print("Ending Balance: ", forecasted.balance)
+        return
+
+    with open(output, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=Transaction.model_fields.keys())
+        writer.writeheader()
+
+        for transaction in forecasted.sorted_transactions:
+            writer.writerow(transaction.model_dump(mode="json"))
+
+    print("Ending Balance: ", forecasted.balance)
+
+
+def set_initial_deposit(checking: Account, starting_balance: float):
+    for transaction in checking.transactions:
+        if transaction.from_ == "Me" and transaction.description == "initial deposit":
+            transaction.amount = starting_balance
+            return
+    checking.submit_transaction("Me", starting_balance, "initial deposit")
+
+
+def build_budget(
+    debts: str,
+    expenses: str,
+    incomes: str,
+    starting_balance: float,
+) -> Budget:
     budget = Budget()
     checking = Account(name="checking")
     checking.submit_transaction("Me", starting_balance, "initial deposit")
@@ -138,15 +366,60 @@ def forecast(
 
     for income in parse_income(incomes):
         handle_incomes(budget, checking, income)
-    forecasted = budget.forecast_account("checking", end_date)
-    with open(output, "w", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=Transaction.model_fields.keys())
-        writer.writeheader()
+    return budget
 
-        for transaction in forecasted.sorted_transactions:
-            writer.writerow(transaction.model_dump(mode="json"))
 
-    print("Ending Balance: ", forecasted.balance)
+def forecast_incremental(
+    debts: str,
+    expenses: str,
+    incomes: str,
+    starting_balance: float,
+    end_date: datetime.datetime,
+    output: str,
+    state_dir: str,
+):
+    def initial_deposit():
+        checking = Account(name="checking")
+        checking.submit_transaction("Me", starting_balance, "initial deposit")
+        return checking.transactions
+
+    def expand(handler, row):
+        def _expand():
+            budget = Budget()
+            checking = Account(name="checking")
+            budget.add_account(checking)
+            handler(budget, checking, row)
+            return budget.forecast_accounts(end_date)["checking"].account.transactions
+
+        return _expand
+
+    sources = {
+        # The deposit is stamped with the time of the run, like a full forecast,
+        # so it is refreshed once a day rather than kept from the first run.
+        "initial deposit": Source(
+            digest=f"{starting_balance}|{datetime.date.today().isoformat()}",
+            expand=initial_deposit,
+        ),
+    }
+    seen = defaultdict(int)
+    for kind, rows, handler in [
+        ("expense", parse_expense(expenses), handle_expenses),
+        ("debt", parse_debts(debts), handle_debts),
+        ("income", parse_income(incomes), handle_incomes),
+    ]:
+        for row in rows:
+            key = f"{kind}: {row.name}"
+            seen[key] += 1
+            if seen[key] > 1:
+                key = f"{key} #{seen[key]}"
+            sources[key] = Source(
+                digest=digest_row(row, end_date.isoformat()),
+                expand=expand(handler, row),
+            )
+
+    changes = IncrementalForecast(state_dir).update(sources, output)
+    print(changes)
+    print("Ending Balance: ", changes.balance)
 
 
 def handle_expenses(budget: Budget, checking: Account, expense: Expense):
@@ -170,17 +443,9 @@ def handle_debts(budget: Budget, checking: Account, debt: Debt):
     budget.add_transfer_schedule(
         checking,
         debt_account,
-        "monthly",
-        debt.name,
-        debt.monthly,
-        debt.due_date,
-    )
-    budget.add_transfer_schedule(
-        debt_account,
-        checking,
         "bi-weekly" if debt.debt_type == "Payday Loan" else "monthly",
         debt.name,
-        -debt.monthly,
+        debt.monthly,
         debt.due_date,
     )
 
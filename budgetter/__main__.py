@@ -1,3 +1,3 @@
 from budgetter import main
 
-main()
\ No newline at end of file
+main()
@@ -2,7 +2,7 @@ import datetime
 from typing import Iterable
 from pydantic import BaseModel
 
-from budgetter.transaction import Transaction
+from budgetter.transaction import Transaction, TransactionBatch
 
 
 class Account(BaseModel):
@@ -25,8 +25,9 @@ class Account(BaseModel):
         to_: "Account",
         amount: float,
         description: str = "Transfering money from one account to another",
+        when: datetime = None,
     ):
-        when = when or datetime.datetime.now(datetime.timezone.utc)
+        when = when or datetime.datetime.now()
         transaction = Transaction(
             amount=amount,
             from_=self.name,
@@ -44,7 +45,7 @@ class Account(BaseModel):
         description: str = "Transfering money from one account to another",
         when: datetime = None,
     ):
-        when = when or datetime.datetime.now(datetime.timezone.utc)
+        when = when or datetime.datetime.now()
         transaction = Transaction(
             amount=amount,
             from_=from_.name,
@@ -73,6 +74,9 @@ class Account(BaseModel):
             )
         )
 
+    def submit_transactions(self, batch: TransactionBatch):
+        self.transactions.extend(batch.received_by(self.name))
+
     def forecast(self, possible_transactions: Iterable[Transaction]) -> "Account":
         return Account(
             name=self.name, transactions=[*possible_transactions, *self.transactions]
@@ -1,9 +1,30 @@
 from collections import defaultdict
 import datetime
+import heapq
+from typing import Iterable
 from pydantic import BaseModel, field_validator
 
 from budgetter.account import Account
 from budgetter.schedule import TransferSchedule, PaymentSchedule
+from budgetter.transaction import Transaction, TransactionBatch
+
+
+class AccountForecast(BaseModel):
+    """A forecasted account with the running balance after each transaction."""
+
+    account: Account
+    balances: list[float] = []
+
+    @property
+    def balance(self):
+        return self.balances[-1] if self.balances else 0.0
+
+
+def _with_owner(
+    transactions: Iterable[Transaction], owner: str | None
+) -> Iterable[tuple[Transaction, str | None]]:
+    for transaction in transactions:
+        yield transaction, owner
 
 
 class Budget(BaseModel):
@@ -14,6 +35,20 @@ class Budget(BaseModel):
     def add_account(self, account: Account):
         self.accounts[account.name] = account
 
+    def submit_transactions(self, account_name: str, batch: TransactionBatch):
+        """Post a batch to ``account_name`` and mirror transfers between accounts.
+
+        Rows whose counterparty is another account in the budget have the
+        opposite leg posted to that account as well.
+        """
+        self.accounts[account_name].submit_transactions(batch)
+        mirrored = defaultdict(list)
+        others = self.accounts.keys() - {account_name}
+        for leg in batch.sent_by(account_name, others):
+            mirrored[leg.to_].append(leg)
+        for name, legs in mirrored.items():
+            self.accounts[name].transactions.extend(legs)
+
     def add_payment_schedule(
         self,
         schedule_name: str,
@@ -63,14 +98,50 @@ class Budget(BaseModel):
         account_name: str,
         end: datetime.datetime,
     ):
-        account = self.accounts[account_name]
-        forecasted = account
-        for payment_schedule in self.payment_schedules[account_name]:
-            forecasted = forecasted.forecast(
-                possible_transactions=payment_schedule.calculate_future_payments(end)
-            )
-        for transfer_schedule in self.transfer_schedules[account_name]:
-            forecasted = forecasted.forecast(
-                possible_transactions=transfer_schedule.calculate_future_payments(end)
+        return self.forecast_accounts(end)[account_name].account
+
+    def forecast_accounts(
+        self,
+        end: datetime.datetime,
+    ) -> dict[str, AccountForecast]:
+        """Forecast every account in the budget in one chronological pass.
+
+        Each schedule is expanded exactly once. Transfers post the receiving
+        leg to ``to_`` and the flipped leg to ``from_`` so both sides stay in
+        balance. Legs for accounts that are not part of the budget are dropped.
+        """
+        # Recorded transactions already belong to a single account, while
+        # scheduled ones (owner ``None``) still need both legs posted.
+        streams: list[Iterable[tuple[Transaction, str | None]]] = [
+            _with_owner(account.sorted_transactions, name)
+            for name, account in self.accounts.items()
+        ]
+        for schedules in [
+            *self.payment_schedules.values(),
+            *self.transfer_schedules.values(),
+        ]:
+            streams.extend(
+                _with_owner(schedule.calculate_future_payments(end), None)
+                for schedule in schedules
             )
-        return forecasted
+
+        forecasts = {
+            name: AccountForecast(account=Account(name=name)) for name in self.accounts
+        }
+        for transaction, owner in heapq.merge(*streams, key=lambda e: e[0].when):
+            if owner is not None:
+                legs = [(owner, transaction)]
+            elif transaction.from_ == transaction.to_:
+                legs = [(transaction.to_, transaction)]
+            else:
+                legs = [
+                    (transaction.to_, transaction),
+                    (transaction.from_, transaction.flip()),
+                ]
+            for name, leg in legs:
+                forecast = forecasts.get(name)
+                if forecast is None:
+                    continue
+                forecast.account.transactions.append(leg)
+                forecast.balances.append(forecast.balance + leg.amount)
+        return forecasts
@@ -0,0 +1,162 @@
+import datetime
+import json
+import struct
+from typing import BinaryIO, Iterable, Iterator
+
+import numpy as np
+
+from budgetter.transaction import Transaction
+
+MAGIC = b"BUDGCOL1"
+ALIGNMENT = 8
+COLUMNS = [
+    ("amount_cents", "<i8"),
+    ("when", "<M8[D]"),
+    ("account", "<i4"),
+    ("counterparty", "<i4"),
+    ("description", "<i4"),
+]
+
+
+def _pad(f: BinaryIO):
+    f.write(b"\0" * (-f.tell() % ALIGNMENT))
+
+
+def is_columnar(path: str) -> bool:
+    with open(path, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def write_columnar(path: str, sorted_transactions: Iterable[Transaction]) -> int:
+    """Write transactions as fixed-width columns behind a small JSON header.
+
+    Amounts are stored as int64 cents, dates as datetime64 days and names and
+    descriptions as ids into the header's interned string tables. Rows must be
+    in date order so readers can binary search them.
+    """
+    accounts: dict[str, int] = {}
+    descriptions: dict[str, int] = {}
+    columns: list[list] = [[] for _ in COLUMNS]
+    amount, when, account, counterparty, description = columns
+    for t in sorted_transactions:
+        amount.append(round(t.amount * 100))
+        when.append(t.when.date())
+        account.append(accounts.setdefault(t.to_, len(accounts)))
+        counterparty.append(accounts.setdefault(t.from_, len(accounts)))
+        description.append(descriptions.setdefault(t.description, len(descriptions)))
+
+    arrays = [np.array(c, dtype=dtype) for c, (_, dtype) in zip(columns, COLUMNS)]
+    if np.any(arrays[1][1:] < arrays[1][:-1]):
+        raise ValueError("Transactions must be sorted by date")
+    header = json.dumps(
+        {
+            "count": len(amount),
+            "columns": COLUMNS,
+            "accounts": list(accounts),
+            "descriptions": list(descriptions),
+        }
+    ).encode()
+    with open(path, "wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<Q", len(header)))
+        f.write(header)
+        for array in arrays:
+            _pad(f)
+            f.write(array.tobytes())
+    return len(amount)
+
+
+class ColumnarForecast:
+    """Memory-mapped, zero-copy view over a file from :func:`write_columnar`.
+
+    Each column is a NumPy view straight onto the mapped file, so opening and
+    slicing never copies rows no matter how large the file is.
+    """
+
+    def __init__(
+        self,
+        columns: dict[str, np.ndarray],
+        accounts: list[str],
+        descriptions: list[str],
+    ):
+        self.columns = columns
+        self.accounts = accounts
+        self.descriptions = descriptions
+
+    @classmethod
+    def open(cls, path: str) -> "ColumnarForecast":
+        data = np.memmap(path, dtype=np.uint8, mode="r")
+        if bytes(data[: len(MAGIC)]) != MAGIC:
+            raise ValueError(f"{path} is not a columnar forecast")
+        offset = len(MAGIC) + 8
+        (header_size,) = struct.unpack("<Q", bytes(data[len(MAGIC) : offset]))
+        header = json.loads(bytes(data[offset : offset + header_size]))
+        offset += header_size
+        count = header["count"]
+        columns = {}
+        for name, dtype in header["columns"]:
+            dtype = np.dtype(dtype)
+            offset += -offset % ALIGNMENT
+            size = count * dtype.itemsize
+            columns[name] = data[offset : offset + size].view(dtype)
+            offset += size
+        return cls(columns, header["accounts"], header["descriptions"])
+
+    def __len__(self):
+        return len(self.columns["amount_cents"])
+
+    def __getitem__(self, index: slice) -> "ColumnarForecast":
+        return ColumnarForecast(
+            {name: column[index] for name, column in self.columns.items()},
+            self.accounts,
+            self.descriptions,
+        )
+
+    @property
+    def amount_cents(self) -> np.ndarray:
+        return self.columns["amount_cents"]
+
+    @property
+    def when(self) -> np.ndarray:
+        return self.columns["when"]
+
+    def between(
+        self, start: datetime.date | None = None, end: datetime.date | None = None
+    ) -> "ColumnarForecast":
+        """Rows from ``start`` through ``end`` inclusive, as views."""
+        low = 0 if start is None else np.searchsorted(self.when, np.datetime64(start))
+        high = (
+            len(self)
+            if end is None
+            else np.searchsorted(self.when, np.datetime64(end), side="right")
+        )
+        return self[low:high]
+
+    def for_account(self, account_name: str) -> "ColumnarForecast":
+        """Rows posted to ``account_name``; a copy since rows are not contiguous."""
+        mask = self.columns["account"] == self.accounts.index(account_name)
+        return ColumnarForecast(
+            {name: column[mask] for name, column in self.columns.items()},
+            self.accounts,
+            self.descriptions,
+        )
+
+    def balances(self, opening_cents: int = 0) -> np.ndarray:
+        """Running balance in cents after each row."""
+        return opening_cents + np.cumsum(self.amount_cents)
+
+    def transactions(self) -> Iterator[Transaction]:
+        for cents, day, account, counterparty, description in zip(
+            self.amount_cents.tolist(),
+            self.when.tolist(),
+            self.columns["account"].tolist(),
+            self.columns["counterparty"].tolist(),
+            self.columns["description"].tolist(),
+        ):
+            yield Transaction.model_construct(
+                amount=cents / 100,
+                description=self.descriptions[description],
+                when=datetime.datetime.combine(day, datetime.time()),
+                from_=self.accounts[counterparty],
+                to_=self.accounts[account],
+            )
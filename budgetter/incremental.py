@@ -0,0 +1,226 @@
+import csv
+import bisect
+import datetime
+import hashlib
+import heapq
+import io
+import json
+import os
+from typing import Callable
+from pydantic import BaseModel, TypeAdapter
+
+from budgetter.transaction import Transaction
+
+STATE_FILE = "state.json"
+STREAMS_DIR = "streams"
+
+_STREAM = TypeAdapter(list[Transaction])
+
+
+class Source(BaseModel):
+    """A parsed input row and how to expand it into checking transactions."""
+
+    digest: str
+    expand: Callable[[], list[Transaction]]
+
+
+class ForecastChanges(BaseModel):
+    added: list[str] = []
+    changed: list[str] = []
+    removed: list[str] = []
+    rewritten_from: datetime.datetime | None = None
+    rows_written: int = 0
+    balance: float = 0.0
+
+    def __str__(self):
+        lines = [
+            *(f"Added: {key}" for key in self.added),
+            *(f"Changed: {key}" for key in self.changed),
+            *(f"Removed: {key}" for key in self.removed),
+        ]
+        if self.rewritten_from is None:
+            lines.append("Output unchanged")
+        else:
+            lines.append(
+                f"Rewrote {self.rows_written} rows from "
+                f"{self.rewritten_from.isoformat()}"
+            )
+        return "\n".join(lines)
+
+
+def digest_row(row: BaseModel, *extra: object) -> str:
+    payload = row.model_dump_json() + "".join(f"|{e}" for e in extra)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class IncrementalForecast:
+    """Forecast state kept between runs so only changed sources are expanded.
+
+    Every source's occurrence stream is stored in its own file under
+    ``state_dir``. On update, sources whose digest is unchanged reuse their
+    stored stream, and the output is truncated at the earliest affected
+    transaction and only the tail is rewritten.
+    """
+
+    def __init__(self, state_dir: str):
+        self.state_dir = state_dir
+        self.streams_dir = os.path.join(state_dir, STREAMS_DIR)
+
+    def _load_state(self) -> dict:
+        try:
+            with open(os.path.join(self.state_dir, STATE_FILE)) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {"sources": {}, "output": None}
+
+    def _save_state(self, state: dict):
+        with open(os.path.join(self.state_dir, STATE_FILE), "w") as f:
+            json.dump(state, f, indent=2)
+
+    def _stream_path(self, key: str) -> str:
+        name = hashlib.sha256(key.encode()).hexdigest()
+        return os.path.join(self.streams_dir, f"{name}.json")
+
+    def _load_stream(self, key: str) -> list[Transaction]:
+        with open(self._stream_path(key), "rb") as f:
+            return _STREAM.validate_json(f.read())
+
+    def _try_load_stream(self, key: str) -> list[Transaction] | None:
+        try:
+            return self._load_stream(key)
+        except (OSError, ValueError):
+            return None
+
+    def _save_stream(self, key: str, stream: list[Transaction]):
+        with open(self._stream_path(key), "wb") as f:
+            f.write(_STREAM.dump_json(stream))
+
+    def update(self, sources: dict[str, Source], output: str) -> ForecastChanges:
+        os.makedirs(self.streams_dir, exist_ok=True)
+        state = self._load_state()
+        previous: dict[str, str] = state["sources"]
+        changes = ForecastChanges(
+            added=[key for key in sources if key not in previous],
+            changed=[
+                key
+                for key, source in sources.items()
+                if key in previous and previous[key] != source.digest
+            ],
+            removed=[key for key in previous if key not in sources],
+        )
+
+        output_is_current = (
+            state["output"] == os.path.abspath(output)
+            and os.path.exists(output)
+            and os.path.getsize(output) == state.get("output_size")
+            and "index" in state
+        )
+        if output_is_current and not (
+            changes.added or changes.changed or changes.removed
+        ):
+            changes.balance = state["balance"]
+            return changes
+
+        cutoff: datetime.datetime | None = None
+
+        def affect(stream: list[Transaction]):
+            nonlocal cutoff
+            if stream and (cutoff is None or stream[0].when < cutoff):
+                cutoff = stream[0].when
+
+        # A stored stream that can't be read means the old output can't be
+        # trusted either, so the whole file is rewritten.
+        missing = False
+        streams: dict[str, list[Transaction]] = {}
+        for key in changes.changed + changes.removed:
+            stream = self._try_load_stream(key)
+            if stream is None:
+                missing = True
+            else:
+                affect(stream)
+        for key in sorted(sources):
+            stream = None
+            if key not in changes.added and key not in changes.changed:
+                stream = self._try_load_stream(key)
+                missing = missing or stream is None
+            if stream is None:
+                stream = sorted(sources[key].expand(), key=lambda t: t.when)
+                self._save_stream(key, stream)
+                affect(stream)
+            streams[key] = stream
+        for key in changes.removed:
+            if os.path.exists(self._stream_path(key)):
+                os.remove(self._stream_path(key))
+
+        changes.balance = sum(t.amount for s in streams.values() for t in s)
+        index = state.get("index", [])
+        if missing or not output_is_current:
+            cutoff = datetime.datetime.min
+            index = []
+        if cutoff is not None:
+            changes.rewritten_from = cutoff
+            changes.rows_written, index = _rewrite_tail(output, streams, cutoff, index)
+
+        self._save_state(
+            {
+                "sources": {key: source.digest for key, source in sources.items()},
+                "output": os.path.abspath(output),
+                "output_size": os.path.getsize(output),
+                "balance": changes.balance,
+                "index": index,
+            }
+        )
+        return changes
+
+
+def _rewrite_tail(
+    output: str,
+    streams: dict[str, list[Transaction]],
+    cutoff: datetime.datetime,
+    index: list[tuple[str, int]],
+) -> tuple[int, list[tuple[str, int]]]:
+    """Rewrite ``output`` from the first row at or after ``cutoff``.
+
+    ``index`` holds the byte offset of the first row for every distinct
+    ``when`` in the file, so the cutoff is found by a binary search instead of
+    reading the rows before it. Returns the rows written and the new index.
+    """
+    fieldnames = list(Transaction.model_fields.keys())
+    whens = [datetime.datetime.fromisoformat(when) for when, _ in index]
+    kept = bisect.bisect_left(whens, cutoff)
+    if kept < len(index):
+        offset = index[kept][1]
+    else:
+        offset = os.path.getsize(output) if index else 0
+    index = [tuple(entry) for entry in index[:kept]]
+
+    merged = heapq.merge(
+        *(streams[key] for key in sorted(streams)), key=lambda t: t.when
+    )
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fieldnames)
+
+    def take() -> bytes:
+        data = buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+        return data
+
+    written = 0
+    with open(output, "r+b" if offset else "wb") as f:
+        f.seek(offset)
+        f.truncate()
+        if not offset:
+            writer.writeheader()
+            offset = f.write(take())
+        last = None
+        for transaction in merged:
+            if transaction.when < cutoff:
+                continue
+            writer.writerow(transaction.model_dump(mode="json"))
+            if transaction.when != last:
+                index.append((transaction.when.isoformat(), offset))
+                last = transaction.when
+            offset += f.write(take())
+            written += 1
+    return written, index
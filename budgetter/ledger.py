@@ -0,0 +1,324 @@
+import datetime
+import sqlite3
+from typing import Iterable, Iterator
+
+from budgetter.account import Account
+from budgetter.budget import Budget
+from budgetter.transaction import Transaction
+
+RECORDED = "transactions"
+FORECASTS = "forecasts"
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS accounts (
+    name TEXT PRIMARY KEY
+);
+CREATE TABLE IF NOT EXISTS schedules (
+    id INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL,
+    name TEXT NOT NULL,
+    from_account TEXT,
+    to_account TEXT NOT NULL,
+    amount REAL NOT NULL,
+    repeat_str TEXT NOT NULL,
+    started TEXT NOT NULL
+);
+""" + "".join(
+    f"""
+CREATE TABLE IF NOT EXISTS {table} (
+    id INTEGER PRIMARY KEY,
+    account TEXT NOT NULL,
+    amount REAL NOT NULL,
+    description TEXT NOT NULL,
+    "when" TEXT NOT NULL,
+    from_ TEXT NOT NULL,
+    to_ TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS {table}_account_when ON {table} (account, "when");
+CREATE INDEX IF NOT EXISTS {table}_account_from ON {table} (account, from_);
+""" for table in (RECORDED, FORECASTS)
+)
+
+
+def _table(forecast: bool) -> str:
+    return FORECASTS if forecast else RECORDED
+
+
+def _bounds(start: datetime.date | None, end: datetime.date | None) -> tuple[str, str]:
+    """ISO bounds so ``start <= when < end + 1 day`` compares as text."""
+    low = start.isoformat() if start else "0000"
+    high = (end + datetime.timedelta(days=1)).isoformat() if end else "9999"
+    return low, high
+
+
+def _transaction(row: tuple) -> Transaction:
+    amount, description, when, from_, to_ = row
+    return Transaction.model_construct(
+        amount=amount,
+        description=description,
+        when=datetime.datetime.fromisoformat(when),
+        from_=from_,
+        to_=to_,
+    )
+
+
+class Ledger:
+    """SQLite storage for accounts, their transactions and budget schedules.
+
+    Recorded transactions and forecast output live in separate tables with the
+    same layout, both indexed on ``(account, when)``, so range and balance
+    queries run in SQL instead of over lists in memory.
+    """
+
+    def __init__(self, path: str, read_only: bool = False):
+        if read_only:
+            self.connection = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+            return
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.executescript(SCHEMA)
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def add_transactions(
+        self,
+        account_name: str,
+        transactions: Iterable[Transaction],
+        forecast: bool = False,
+    ):
+        with self.connection:
+            self._insert({account_name: transactions}, forecast)
+
+    def clear_transactions(self, account_name: str, forecast: bool = False):
+        with self.connection:
+            self._clear([account_name], forecast)
+
+    def save_account(self, account: Account):
+        with self.connection:
+            self._replace([account])
+
+    def _insert(
+        self, transactions: dict[str, Iterable[Transaction]], forecast: bool = False
+    ):
+        """Insert every account's rows with one ``executemany``, uncommitted."""
+        self.connection.executemany(
+            "INSERT OR IGNORE INTO accounts (name) VALUES (?)",
+            ((name,) for name in transactions),
+        )
+        self.connection.executemany(
+            f"""
+            INSERT INTO {_table(forecast)}
+                (account, amount, description, "when", from_, to_)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            (
+                (
+                    name,
+                    t.amount,
+                    t.description,
+                    t.when.isoformat(),
+                    t.from_,
+                    t.to_,
+                )
+                for name, rows in transactions.items()
+                for t in rows
+            ),
+        )
+
+    def _clear(self, account_names: Iterable[str], forecast: bool = False):
+        self.connection.executemany(
+            f"DELETE FROM {_table(forecast)} WHERE account = ?",
+            ((name,) for name in account_names),
+        )
+
+    def _replace(self, accounts: Iterable[Account], forecast: bool = False):
+        accounts = list(accounts)
+        self._clear((a.name for a in accounts), forecast)
+        self._insert({a.name: a.transactions for a in accounts}, forecast)
+
+    def load_account(
+        self,
+        account_name: str,
+        start: datetime.date | None = None,
+        end: datetime.date | None = None,
+        forecast: bool = False,
+    ) -> Account:
+        return Account(
+            name=account_name,
+            transactions=list(self.transactions(account_name, start, end, forecast)),
+        )
+
+    def account_names(self) -> list[str]:
+        return [
+            name
+            for (name,) in self.connection.execute(
+                "SELECT name FROM accounts ORDER BY name"
+            )
+        ]
+
+    def transactions(
+        self,
+        account_name: str,
+        start: datetime.date | None = None,
+        end: datetime.date | None = None,
+        forecast: bool = False,
+    ) -> Iterator[Transaction]:
+        """Transactions for ``account_name`` between ``start`` and ``end`` by date."""
+        cursor = self.connection.execute(
+            f'SELECT amount, description, "when", from_, to_ FROM {_table(forecast)} '
+            'WHERE account = ? AND "when" >= ? AND "when" < ? ORDER BY "when", id',
+            (account_name, *_bounds(start, end)),
+        )
+        return map(_transaction, cursor)
+
+    def transactions_with(
+        self, account_name: str, counterparty: str, forecast: bool = False
+    ) -> Iterator[Transaction]:
+        cursor = self.connection.execute(
+            f'SELECT amount, description, "when", from_, to_ FROM {_table(forecast)} '
+            'WHERE account = ? AND from_ = ? ORDER BY "when", id',
+            (account_name, counterparty),
+        )
+        return map(_transaction, cursor)
+
+    def date_range(
+        self, account_name: str, forecast: bool = False
+    ) -> tuple[datetime.date, datetime.date] | None:
+        first, last = self.connection.execute(
+            f"""
+            SELECT MIN("when"), MAX("when") FROM {_table(forecast)}
+            WHERE account = ?
+            """,
+            (account_name,),
+        ).fetchone()
+        if first is None:
+            return None
+        return (
+            datetime.datetime.fromisoformat(first).date(),
+            datetime.datetime.fromisoformat(last).date(),
+        )
+
+    def balance_before(
+        self, account_name: str, day: datetime.date, forecast: bool = False
+    ) -> float:
+        (balance,) = self.connection.execute(
+            f"""
+            SELECT COALESCE(SUM(amount), 0) FROM {_table(forecast)}
+            WHERE account = ? AND "when" < ?
+            """,
+            (account_name, day.isoformat()),
+        ).fetchone()
+        return balance
+
+    def balance_on_day(
+        self, account_name: str, day: datetime.date, forecast: bool = False
+    ) -> float:
+        return self.balance_before(
+            account_name, day + datetime.timedelta(days=1), forecast
+        )
+
+    def running_balances(
+        self,
+        account_name: str,
+        start: datetime.date | None = None,
+        end: datetime.date | None = None,
+        forecast: bool = False,
+    ) -> Iterator[tuple[datetime.datetime, float]]:
+        """Balance after each transaction in the range, including earlier activity."""
+        low, high = _bounds(start, end)
+        cursor = self.connection.execute(
+            f"""
+            SELECT "when", balance FROM (
+                SELECT "when", id, SUM(amount) OVER (ORDER BY "when", id) AS balance
+                FROM {_table(forecast)} WHERE account = ? AND "when" < ?
+            ) WHERE "when" >= ? ORDER BY "when", id
+            """,
+            (account_name, high, low),
+        )
+        for when, balance in cursor:
+            yield datetime.datetime.fromisoformat(when), balance
+
+    def save_budget(self, budget: Budget):
+        """Replace the stored budget, dropping accounts no longer in it."""
+        with self.connection:
+            stale = [
+                name for name in self.account_names() if name not in budget.accounts
+            ]
+            self._clear(stale)
+            self._clear(stale, forecast=True)
+            self.connection.executemany(
+                "DELETE FROM accounts WHERE name = ?", ((name,) for name in stale)
+            )
+            self.connection.execute("DELETE FROM schedules")
+            self.connection.executemany(
+                """
+                INSERT INTO schedules
+                    (kind, name, from_account, to_account, amount, repeat_str, started)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                [
+                    *(
+                        (
+                            "payment",
+                            s.name,
+                            None,
+                            s.to.name,
+                            s.amount,
+                            s.repeat_str,
+                            s.started.isoformat(),
+                        )
+                        for schedules in budget.payment_schedules.values()
+                        for s in schedules
+                    ),
+                    *(
+                        (
+                            "transfer",
+                            s.name,
+                            s.from_.name,
+                            s.to.name,
+                            s.amount,
+                            s.repeat_str,
+                            s.started.isoformat(),
+                        )
+                        for schedules in budget.transfer_schedules.values()
+                        for s in schedules
+                    ),
+                ],
+            )
+            self._replace(budget.accounts.values())
+
+    def load_budget(self) -> Budget:
+        budget = Budget()
+        for name in self.account_names():
+            budget.add_account(self.load_account(name))
+        cursor = self.connection.execute("""
+            SELECT kind, name, from_account, to_account, amount, repeat_str, started
+            FROM schedules ORDER BY id
+            """)
+        for kind, name, from_, to, amount, repeat_str, started in cursor:
+            started = datetime.date.fromisoformat(started)
+            if kind == "payment":
+                budget.add_payment_schedule(
+                    name, budget.accounts[to], repeat_str, amount, started
+                )
+            else:
+                budget.add_transfer_schedule(
+                    budget.accounts[from_],
+                    budget.accounts[to],
+                    repeat_str,
+                    name,
+                    amount,
+                    started,
+                )
+        return budget
+
+    def save_forecasts(self, accounts: Iterable[Account]):
+        with self.connection:
+            self._replace(accounts, forecast=True)
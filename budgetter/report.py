@@ -0,0 +1,224 @@
+import datetime
+from enum import Enum
+from typing import Iterable
+from pydantic import BaseModel
+
+from budgetter.account import Account
+from budgetter.parse import Debt, Expense, Income
+from budgetter.schedule import payment_description, transfer_description
+from budgetter.transaction import Transaction
+
+UNCATEGORIZED = "Uncategorized"
+
+
+class Granularity(str, Enum):
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
+    QUARTER = "quarter"
+
+    def period_start(self, day: datetime.date) -> datetime.date:
+        if self == Granularity.WEEK:
+            return day - datetime.timedelta(days=day.weekday())
+        if self == Granularity.MONTH:
+            return day.replace(day=1)
+        if self == Granularity.QUARTER:
+            return datetime.date(day.year, 3 * ((day.month - 1) // 3) + 1, 1)
+        return day
+
+
+class BalancePeriod(BaseModel):
+    date: datetime.date
+    open: float
+    close: float
+    min: float
+    max: float
+
+    def post(self, balance: float):
+        self.close = balance
+        self.min = min(self.min, balance)
+        self.max = max(self.max, balance)
+
+
+def resample_balances(
+    sorted_transactions: Iterable[Transaction],
+    granularities: Iterable[Granularity],
+    start: datetime.date,
+    end: datetime.date,
+    balance: float = 0.0,
+) -> dict[Granularity, list[BalancePeriod]]:
+    """Aggregate running balances into periods for every granularity at once.
+
+    Walks each day from ``start`` to ``end`` (inclusive) exactly once while
+    consuming ``sorted_transactions`` in step, so days without activity carry
+    the previous balance forward. Activity before ``start`` only contributes
+    to the opening balance, on top of ``balance``, and activity after ``end``
+    is ignored.
+    """
+    granularities = list(dict.fromkeys(granularities))
+    periods: dict[Granularity, list[BalancePeriod]] = {g: [] for g in granularities}
+    transactions = iter(sorted_transactions)
+    pending = next(transactions, None)
+    while pending is not None and pending.when.date() < start:
+        balance += pending.amount
+        pending = next(transactions, None)
+
+    day = start
+    while day <= end:
+        current = []
+        for granularity in granularities:
+            bucket = periods[granularity]
+            key = granularity.period_start(day)
+            if not bucket or bucket[-1].date != key:
+                bucket.append(
+                    BalancePeriod(
+                        date=key,
+                        open=balance,
+                        close=balance,
+                        min=balance,
+                        max=balance,
+                    )
+                )
+            current.append(bucket[-1])
+        while pending is not None and pending.when.date() == day:
+            balance += pending.amount
+            for period in current:
+                period.post(balance)
+            pending = next(transactions, None)
+        day += datetime.timedelta(days=1)
+    return periods
+
+
+class BalancePoint(BaseModel):
+    when: datetime.datetime
+    balance: float
+
+
+class ForecastSummary(BaseModel):
+    balances: list[BalancePoint] = []
+    category_totals: dict[datetime.date, dict[str, float]] = {}
+
+
+def category_lookup(
+    expenses: Iterable[Expense],
+    debts: Iterable[Debt],
+    incomes: Iterable[Income],
+    account_name: str = "checking",
+) -> dict[tuple[str, bool], str]:
+    """Map ``(description, is_credit)`` of each input row's legs to its type.
+
+    Expenses and incomes share a description format, so the sign of the
+    amount keeps an expense and an income with the same name apart.
+    """
+    categories = {}
+    for expense in expenses:
+        description = payment_description(expense.name, account_name)
+        categories[description, False] = expense.expense_type
+    for income in incomes:
+        description = payment_description(income.name, account_name)
+        categories[description, True] = income.income_type
+    for debt in debts:
+        description = transfer_description(account_name, debt.name)
+        categories[description, False] = debt.debt_type
+        categories[description, True] = debt.debt_type
+    return categories
+
+
+class _Bucket:
+    """First, lowest, highest and last ``(seq, when, balance)`` seen.
+
+    Points are plain tuples until the bucket is closed; ``seq`` keeps rows
+    that share a timestamp in their original order.
+    """
+
+    def __init__(self, point: tuple[int, datetime.datetime, float]):
+        self.first = self.low = self.high = self.last = point
+
+    def post(self, point: tuple[int, datetime.datetime, float]):
+        if point[2] < self.low[2]:
+            self.low = point
+        elif point[2] > self.high[2]:
+            self.high = point
+        self.last = point
+
+    def points(self, limit: int) -> list[BalancePoint]:
+        # When fewer than four points fit, the closing balance matters most.
+        chosen = list(dict.fromkeys([self.last, self.low, self.high, self.first]))
+        return [
+            BalancePoint(when=when, balance=balance)
+            for _, when, balance in sorted(chosen[:limit])
+        ]
+
+
+def summarize_forecast(
+    sorted_transactions: Iterable[Transaction],
+    points: int,
+    start: datetime.datetime,
+    end: datetime.datetime,
+    granularity: Granularity = Granularity.MONTH,
+    categories: dict[tuple[str, bool], str] | None = None,
+    balance: float = 0.0,
+) -> ForecastSummary:
+    """Downsample a forecast for plotting in one streaming pass.
+
+    The range from ``start`` to ``end`` is split into equal buckets and each
+    keeps its first, lowest, highest and last running balance, so dips below
+    zero and the closing balance survive however coarse the output is. At
+    most ``points`` points are returned. Amounts are also totalled per
+    ``granularity`` period and per category, looked up in ``categories`` by
+    description and whether the amount is a credit. Memory is bounded by the
+    bucket count and the number of periods, not by the number of transactions.
+    """
+    if points < 1:
+        raise ValueError("points must be at least 1")
+    per_bucket = min(4, points)
+    count = points // per_bucket
+    width = max((end - start) / count, datetime.timedelta(microseconds=1))
+    categories = categories or {}
+    summary = ForecastSummary()
+    current: _Bucket | None = None
+    current_index = -1
+    for seq, transaction in enumerate(sorted_transactions):
+        when = transaction.when
+        if when > end:
+            break
+        balance += transaction.amount
+        if when < start:
+            continue
+        index = min(int((when - start) / width), count - 1)
+        if index != current_index:
+            if current is not None:
+                summary.balances.extend(current.points(per_bucket))
+            current = _Bucket((seq, when, balance))
+            current_index = index
+        else:
+            current.post((seq, when, balance))
+
+        period = granularity.period_start(when.date())
+        totals = summary.category_totals.setdefault(period, {})
+        category = categories.get(
+            (transaction.description, transaction.amount > 0), UNCATEGORIZED
+        )
+        totals[category] = totals.get(category, 0.0) + transaction.amount
+    if current is not None:
+        summary.balances.extend(current.points(per_bucket))
+    return summary
+
+
+def summarize_account(
+    account: Account,
+    points: int,
+    granularity: Granularity = Granularity.MONTH,
+    categories: dict[tuple[str, bool], str] | None = None,
+) -> ForecastSummary:
+    transactions = account.sorted_transactions
+    if not transactions:
+        return ForecastSummary()
+    return summarize_forecast(
+        transactions,
+        points,
+        transactions[0].when,
+        transactions[-1].when,
+        granularity,
+        categories,
+    )
@@ -20,6 +20,14 @@ KNOWN_PATTERNS = {
 }
 
 
+def payment_description(schedule_name: str, account_name: str) -> str:
+    return f"Scheduled Payment of {schedule_name} for {account_name}"
+
+
+def transfer_description(from_name: str, to_name: str) -> str:
+    return f"Transfering from {from_name} to {to_name}"
+
+
 def parse_schedule_repeat(schedule: str):
     for pattern in KNOWN_PATTERNS:
         match = re.match(pattern, schedule)
@@ -52,7 +60,7 @@ class PaymentSchedule(BaseSchedule):
         while current < end:
             yield Transaction(
                 amount=current_amount,
-                description=f"Scheduled Payment of {self.name} for {self.to.name}",
+                description=payment_description(self.name, self.to.name),
                 when=current,
                 from_=self.to.name,
                 to_=self.to.name,
@@ -98,7 +106,7 @@ class TransferSchedule(BaseSchedule):
                 amount=self.amount,
                 from_=self.from_.name,
                 to_=self.to.name,
-                description=f"Transfering from {self.from_.name} to {self.to.name}",
+                description=transfer_description(self.from_.name, self.to.name),
                 when=current,
             )
             current += self.repeat
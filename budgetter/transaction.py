@@ -1,5 +1,6 @@
 import datetime
-from pydantic import BaseModel
+from typing import Any, Container, Iterable
+from pydantic import BaseModel, model_validator
 
 
 class Transaction(BaseModel):
@@ -17,3 +18,91 @@ class Transaction(BaseModel):
             from_=self.to_,
             to_=self.from_,
         )
+
+
+class TransactionBatch(BaseModel):
+    """Columns of transactions validated in bulk rather than row by row."""
+
+    amount: list[float] = []
+    when: list[datetime.datetime] = []
+    description: list[str] = []
+    counterparty: list[str] = []
+
+    @model_validator(mode="after")
+    def validate_lengths(self):
+        if not (
+            len(self.amount)
+            == len(self.when)
+            == len(self.description)
+            == len(self.counterparty)
+        ):
+            raise ValueError("All transaction columns must be the same length")
+        return self
+
+    @model_validator(mode="before")
+    @classmethod
+    def split_rows(cls, data: Any):
+        if not isinstance(data, dict) or "rows" not in data:
+            return data
+        columns = ([], [], [], [])
+        for index, row in enumerate(data["rows"]):
+            if len(row) != len(columns):
+                raise ValueError(
+                    f"Row {index} has {len(row)} fields, expected "
+                    "(amount, when, description, counterparty)"
+                )
+            for column, value in zip(columns, row):
+                column.append(value)
+        amount, when, description, counterparty = columns
+        return {
+            "amount": amount,
+            "when": when,
+            "description": description,
+            "counterparty": counterparty,
+        }
+
+    @classmethod
+    def from_rows(
+        cls, rows: Iterable[tuple[float, datetime.datetime, str, str]]
+    ) -> "TransactionBatch":
+        return cls.model_validate({"rows": rows})
+
+    def __len__(self):
+        return len(self.amount)
+
+    def received_by(self, account_name: str) -> list[Transaction]:
+        """Legs posted to ``account_name`` from each row's counterparty."""
+        return [
+            Transaction.model_construct(
+                amount=amount,
+                description=description,
+                when=when,
+                from_=counterparty,
+                to_=account_name,
+            )
+            for amount, when, description, counterparty in zip(
+                self.amount, self.when, self.description, self.counterparty
+            )
+        ]
+
+    def sent_by(
+        self, account_name: str, counterparties: Container[str] | None = None
+    ) -> list[Transaction]:
+        """Mirrored legs posted to each row's counterparty.
+
+        When ``counterparties`` is given, only rows whose counterparty is in it
+        produce a leg.
+        """
+        return [
+            Transaction.model_construct(
+                amount=-amount,
+                description=description,
+                when=when,
+                from_=account_name,
+                to_=counterparty,
+            )
+            for amount, when, description, counterparty in zip(
+                self.amount, self.when, self.description, self.counterparty
+            )
+            if counterparties is None or counterparty in counterparties
+        ]
@@ -0,0 +1,77 @@
+import datetime
+
+import pytest
+from pydantic import ValidationError
+
+from budgetter.account import Account
+from budgetter.budget import Budget
+from budgetter.transaction import TransactionBatch
+
+
+def test_submit_transactions__when_given_columns__appends_all_rows():
+    account = Account(name="checking")
+    batch = TransactionBatch(
+        amount=[10, "20.5"],
+        when=["2025-01-01", datetime.datetime(2025, 1, 2)],
+        description=["a", "b"],
+        counterparty=["Me", "Me"],
+    )
+
+    account.submit_transactions(batch)
+
+    assert account.balance == 30.5
+    assert [t.to_ for t in account.transactions] == ["checking", "checking"]
+    assert account.transactions[0].when == datetime.datetime(2025, 1, 1)
+
+
+def test_transaction_batch__when_columns_differ_in_length__raises():
+    with pytest.raises(ValidationError):
+        TransactionBatch(
+            amount=[10],
+            when=[],
+            description=["a"],
+            counterparty=["Me"],
+        )
+
+
+def test_transaction_batch__when_given_no_rows__is_empty():
+    assert len(TransactionBatch.from_rows([])) == 0
+
+
+@pytest.mark.parametrize(
+    "row",
+    [
+        (10, "2025-01-01", "a"),
+        (10, "2025-01-01", "a", "Me", "extra"),
+    ],
+)
+def test_transaction_batch__when_row_has_wrong_field_count__raises(row):
+    with pytest.raises(ValidationError):
+        TransactionBatch.from_rows([(5, "2025-01-01", "b", "Me"), row])
+
+
+def test_transfer_to__when_given_no_date__posts_both_legs():
+    checking = Account(name="checking")
+    savings = Account(name="savings")
+
+    checking.transfer_to(savings, 25)
+
+    assert checking.balance == -25
+    assert savings.balance == 25
+
+
+def test_transfer_to__when_mixed_with_submitted_transactions__sorts_and_forecasts():
+    checking = Account(name="checking")
+    savings = Account(name="savings")
+    budget = Budget()
+    budget.add_account(checking)
+    budget.add_account(savings)
+
+    checking.submit_transaction("Me", 100, "deposit")
+    checking.transfer_to(savings, 25)
+    checking.transfer_from(savings, 5)
+
+    assert [t.amount for t in checking.sorted_transactions] == [100, -25, 5]
+    forecasts = budget.forecast_accounts(datetime.datetime(2025, 1, 1))
+    assert forecasts["checking"].balance == 80
+    assert forecasts["savings"].balance == 20
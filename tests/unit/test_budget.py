@@ -0,0 +1,120 @@
+import datetime
+
+import pytest
+
+from budgetter import handle_debts
+from budgetter.account import Account
+from budgetter.budget import Budget
+from budgetter.parse import Debt
+from budgetter.transaction import TransactionBatch
+
+
+def create_budget():
+    budget = Budget()
+    checking = Account(name="checking")
+    checking.submit_transaction(
+        "Me", 1000, "initial deposit", datetime.datetime(2025, 1, 1)
+    )
+    loan = Account(name="loan")
+    loan.submit_transaction(
+        "Me", -300, "initial deposit", datetime.datetime(2025, 1, 1)
+    )
+    budget.add_account(checking)
+    budget.add_account(loan)
+    return budget, checking, loan
+
+
+def test_forecast_accounts__when_given_transfer__posts_both_legs():
+    budget, checking, loan = create_budget()
+    budget.add_transfer_schedule(
+        checking, loan, "monthly", "loan", 100, datetime.date(2025, 1, 15)
+    )
+
+    forecasts = budget.forecast_accounts(datetime.datetime(2025, 4, 1))
+
+    assert forecasts["checking"].balances == [1000, 900, 800, 700]
+    assert forecasts["loan"].balances == [-300, -200, -100, 0]
+
+
+def test_forecast_accounts__when_given_payment__posts_single_leg():
+    budget, checking, _ = create_budget()
+    budget.add_payment_schedule(
+        "rent", checking, "monthly", -500, datetime.date(2025, 1, 2)
+    )
+
+    forecasts = budget.forecast_accounts(datetime.datetime(2025, 2, 3))
+
+    assert forecasts["checking"].balances == [1000, 500, 0]
+    assert forecasts["loan"].balances == [-300]
+
+
+def test_forecast_accounts__when_given_many_schedules__transactions_are_chronological():
+    budget, checking, loan = create_budget()
+    budget.add_payment_schedule(
+        "pay", checking, "bi-weekly", 200, datetime.date(2025, 1, 3)
+    )
+    budget.add_transfer_schedule(
+        checking, loan, "monthly", "loan", 50, datetime.date(2025, 1, 10)
+    )
+
+    forecasts = budget.forecast_accounts(datetime.datetime(2025, 6, 1))
+
+    whens = [t.when for t in forecasts["checking"].account.transactions]
+    assert whens == sorted(whens)
+    # 11 bi-weekly deposits of 200 and 5 monthly transfers of 50 before June
+    assert forecasts["checking"].balance == 1000 + 11 * 200 - 5 * 50
+    assert forecasts["loan"].balance == -300 + 5 * 50
+
+
+def test_submit_transactions__when_counterparty_is_account__posts_both_legs():
+    budget, checking, loan = create_budget()
+    batch = TransactionBatch.from_rows(
+        [
+            (-100, "2025-02-01", "loan payment", "loan"),
+            (50, "2025-02-02", "refund", "Store"),
+        ]
+    )
+
+    budget.submit_transactions("checking", batch)
+
+    assert checking.balance == 950
+    assert loan.balance == -200
+    assert loan.transactions[-1].from_ == "checking"
+
+
+@pytest.mark.parametrize(
+    "debt_type, payments",
+    [
+        # Jan 15, Feb 15 and Mar 15
+        ("Credit Card", 3),
+        # every two weeks from Jan 15 through Mar 26
+        ("Payday Loan", 6),
+    ],
+)
+def test_forecast_account__when_debt_handled__pays_from_checking_once(
+    debt_type, payments
+):
+    budget = Budget()
+    checking = Account(name="checking")
+    checking.submit_transaction(
+        "Me", 1000, "initial deposit", datetime.datetime(2025, 1, 1)
+    )
+    budget.add_account(checking)
+    debt = Debt(
+        name="loan",
+        current_balance=300,
+        monthly=50,
+        due_date="1/15/2025",
+        debt_type=debt_type,
+    )
+    handle_debts(budget, checking, debt)
+
+    end = datetime.datetime(2025, 4, 1)
+    forecasted = budget.forecast_account("checking", end)
+    loan = budget.forecast_account("loan", end)
+
+    assert forecasted.balance == 1000 - payments * 50
+    assert loan.balance == -300 + payments * 50
+    assert all(
+        t.from_ == "loan" and t.amount == -50 for t in forecasted.transactions[1:]
+    )
@@ -0,0 +1,172 @@
+import pathlib
+import re
+
+import pytest
+from click.testing import CliRunner
+
+from budgetter import main
+from budgetter.ledger import Ledger
+
+HEADER = "date,open,close,min,max"
+EXAMPLES = pathlib.Path(__file__).parents[2]
+
+
+def test_balance_sheet__when_forecast_empty__writes_headers(tmp_path):
+    forecast = tmp_path / "forecast.csv"
+    forecast.write_text("amount,description,when,from_,to_\n")
+    output = tmp_path / "output.csv"
+
+    result = CliRunner().invoke(
+        main,
+        ["balance-sheet", "-f", str(forecast), "-o", str(output), "-g", "week"],
+    )
+
+    assert result.exit_code == 0
+    assert output.read_text().strip() == HEADER
+
+
+def test_balance_sheet__when_start_after_last_transaction__is_usage_error(tmp_path):
+    forecast = tmp_path / "forecast.csv"
+    forecast.write_text(
+        "amount,description,when,from_,to_\n"
+        "10.0,test,2025-01-01T00:00:00,Me,checking\n"
+    )
+
+    result = CliRunner().invoke(
+        main,
+        [
+            "balance-sheet",
+            "-f",
+            str(forecast),
+            "-o",
+            str(tmp_path / "output.csv"),
+            "--start",
+            "2025-02-01",
+        ],
+    )
+
+    assert result.exit_code == 2
+    assert "--start 2025-02-01" in result.output
+
+
+def test_forecast__when_reading_ledger__applies_starting_balance(tmp_path):
+    ledger = str(tmp_path / "ledger.db")
+    runner = CliRunner()
+    runner.invoke(
+        main,
+        [
+            "forecast",
+            "-d",
+            str(EXAMPLES / "example.debts.csv"),
+            "-e",
+            str(EXAMPLES / "example.expenses.csv"),
+            "-i",
+            str(EXAMPLES / "example.income.csv"),
+            "--ledger",
+            ledger,
+            "0",
+            "2026-01-01",
+        ],
+    )
+
+    balances = [
+        float(re.search(r"Ending Balance:\s+(\S+)", result.output).group(1))
+        for result in (
+            runner.invoke(main, ["forecast", "--ledger", ledger, amount, "2026-01-01"])
+            for amount in ["0", "1000"]
+        )
+    ]
+
+    assert balances[1] - balances[0] == pytest.approx(1000)
+
+
+def test_balance_sheet__when_reading_binary_window__matches_csv(tmp_path):
+    runner = CliRunner()
+    inputs = [
+        "-d",
+        str(EXAMPLES / "example.debts.csv"),
+        "-e",
+        str(EXAMPLES / "example.expenses.csv"),
+        "-i",
+        str(EXAMPLES / "example.income.csv"),
+    ]
+    sheets = []
+    for output_format in ["csv", "binary"]:
+        forecast = str(tmp_path / f"forecast.{output_format}")
+        sheet = tmp_path / f"sheet.{output_format}.csv"
+        runner.invoke(
+            main,
+            ["forecast", *inputs, "-o", forecast, "--format", output_format]
+            + ["100", "2026-01-01"],
+        )
+        runner.invoke(
+            main,
+            ["balance-sheet", "-f", forecast, "-o", str(sheet), "-g", "week"]
+            + ["--start", "2025-06-01", "--end", "2025-09-01"],
+        )
+        sheets.append(sheet.read_text())
+
+    assert sheets[0] == sheets[1]
+    assert len(sheets[0].splitlines()) > 1
+
+
+@pytest.mark.parametrize(
+    "window, message",
+    [
+        (["--end", "2024-12-01"], "before the first transaction"),
+        (["--start", "2025-02-01"], "after the last transaction"),
+        (["--start", "2025-02-01", "--end", "2025-01-15"], "is after --end"),
+    ],
+)
+def test_balance_sheet__when_window_is_empty__names_given_option(
+    tmp_path, window, message
+):
+    forecast = tmp_path / "forecast.csv"
+    forecast.write_text(
+        "amount,description,when,from_,to_\n"
+        "10.0,test,2025-01-01T00:00:00,Me,checking\n"
+    )
+
+    result = CliRunner().invoke(
+        main,
+        ["balance-sheet", "-f", str(forecast), "-o", str(tmp_path / "out.csv")]
+        + window,
+    )
+
+    assert result.exit_code == 2
+    assert message in result.output
+
+
+def test_forecast__when_ledger_missing__is_usage_error(tmp_path):
+    ledger = tmp_path / "missing.db"
+
+    result = CliRunner().invoke(
+        main, ["forecast", "--ledger", str(ledger), "100", "2026-06-01"]
+    )
+
+    assert result.exit_code == 2
+    assert not ledger.exists()
+
+
+def test_forecast__when_ledger_has_no_checking__is_usage_error(tmp_path):
+    ledger = tmp_path / "empty.db"
+    Ledger(str(ledger)).close()
+
+    result = CliRunner().invoke(
+        main, ["forecast", "--ledger", str(ledger), "100", "2026-06-01"]
+    )
+
+    assert result.exit_code == 2
+    assert "no checking account" in result.output
+
+
+def test_balance_sheet__when_ledger_missing__does_not_create_it(tmp_path):
+    ledger = tmp_path / "typo.db"
+
+    result = CliRunner().invoke(
+        main,
+        ["balance-sheet", "--ledger", str(ledger), "-o", str(tmp_path / "out.csv")],
+    )
+
+    assert result.exit_code == 2
+    assert not ledger.exists()
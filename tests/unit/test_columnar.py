@@ -0,0 +1,64 @@
+import datetime
+
+import numpy as np
+import pytest
+
+from budgetter.columnar import ColumnarForecast, is_columnar, write_columnar
+from budgetter.transaction import Transaction
+
+
+def create_transaction(amount: float, day: int, to_: str = "checking"):
+    return Transaction(
+        amount=amount,
+        description=f"payment {amount}",
+        when=datetime.datetime(2025, 1, day),
+        from_="Me",
+        to_=to_,
+    )
+
+
+TRANSACTIONS = [
+    create_transaction(100, 1),
+    create_transaction(-10.99, 3),
+    create_transaction(5, 3, "savings"),
+    create_transaction(-0.01, 9),
+]
+
+
+def test_columnar__when_written__round_trips_transactions(tmp_path):
+    path = str(tmp_path / "forecast.bin")
+    write_columnar(path, TRANSACTIONS)
+
+    columns = ColumnarForecast.open(path)
+
+    assert is_columnar(path)
+    assert list(columns.transactions()) == TRANSACTIONS
+    assert columns.amount_cents.tolist() == [10000, -1099, 500, -1]
+    assert columns.balances()[-1] == 9400
+
+
+def test_columnar__between__returns_views_of_date_range(tmp_path):
+    path = str(tmp_path / "forecast.bin")
+    write_columnar(path, TRANSACTIONS)
+
+    window = ColumnarForecast.open(path).between(
+        datetime.date(2025, 1, 2), datetime.date(2025, 1, 3)
+    )
+
+    assert window.amount_cents.tolist() == [-1099, 500]
+    assert isinstance(window.amount_cents.base, np.ndarray)
+    assert window.when[0] == np.datetime64("2025-01-03")
+
+
+def test_columnar__for_account__filters_rows(tmp_path):
+    path = str(tmp_path / "forecast.bin")
+    write_columnar(path, TRANSACTIONS)
+
+    savings = ColumnarForecast.open(path).for_account("savings")
+
+    assert savings.amount_cents.tolist() == [500]
+
+
+def test_write_columnar__when_unsorted__raises(tmp_path):
+    with pytest.raises(ValueError):
+        write_columnar(str(tmp_path / "forecast.bin"), TRANSACTIONS[::-1])
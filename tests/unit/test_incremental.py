@@ -0,0 +1,149 @@
+import csv
+
+from budgetter.incremental import IncrementalForecast, Source
+from budgetter.transaction import Transaction
+
+
+def create_stream(amount: float, *days: int):
+    return [
+        Transaction(
+            amount=amount,
+            description=f"{amount}",
+            when=f"2025-01-{day:02}",
+            from_="checking",
+            to_="checking",
+        )
+        for day in days
+    ]
+
+
+def create_source(digest: str, stream: list[Transaction], calls: list[str]):
+    def expand():
+        calls.append(digest)
+        return stream
+
+    return Source(digest=digest, expand=expand)
+
+
+def read_amounts(path):
+    with open(path, newline="") as f:
+        return [float(row["amount"]) for row in csv.DictReader(f)]
+
+
+def test_update__when_one_source_changes__only_expands_that_source(tmp_path):
+    output = tmp_path / "output.csv"
+    forecast = IncrementalForecast(str(tmp_path / "state"))
+    calls = []
+    forecast.update(
+        {
+            "a": create_source("a1", create_stream(1, 1, 3, 5), calls),
+            "b": create_source("b1", create_stream(10, 2, 4), calls),
+        },
+        str(output),
+    )
+
+    changes = forecast.update(
+        {
+            "a": create_source("a1", create_stream(1, 1, 3, 5), calls),
+            "b": create_source("b2", create_stream(20, 4), calls),
+        },
+        str(output),
+    )
+
+    assert calls == ["a1", "b1", "b2"]
+    assert changes.changed == ["b"]
+    assert changes.rows_written == 3
+    assert read_amounts(output) == [1, 1, 20, 1]
+    assert changes.balance == 23
+
+
+def test_update__when_nothing_changes__leaves_output_alone(tmp_path):
+    output = tmp_path / "output.csv"
+    forecast = IncrementalForecast(str(tmp_path / "state"))
+    sources = {"a": create_source("a1", create_stream(1, 1, 2), [])}
+    forecast.update(sources, str(output))
+
+    changes = forecast.update(sources, str(output))
+
+    assert changes.rewritten_from is None
+    assert read_amounts(output) == [1, 1]
+
+
+def test_update__when_source_removed__drops_its_rows(tmp_path):
+    output = tmp_path / "output.csv"
+    forecast = IncrementalForecast(str(tmp_path / "state"))
+    forecast.update(
+        {
+            "a": create_source("a1", create_stream(1, 1, 2), []),
+            "b": create_source("b1", create_stream(10, 2), []),
+        },
+        str(output),
+    )
+
+    changes = forecast.update(
+        {"a": create_source("a1", create_stream(1, 1, 2), [])}, str(output)
+    )
+
+    assert changes.removed == ["b"]
+    assert read_amounts(output) == [1, 1]
+
+
+def test_update__when_stored_stream_missing__rewrites_whole_output(tmp_path):
+    output = tmp_path / "output.csv"
+    state = tmp_path / "state"
+    forecast = IncrementalForecast(str(state))
+    forecast.update(
+        {
+            "a": create_source("a1", create_stream(1, 1, 2), []),
+            "b": create_source("b1", create_stream(10, 3), []),
+        },
+        str(output),
+    )
+    for stream in (state / "streams").iterdir():
+        stream.unlink()
+
+    changes = forecast.update(
+        {
+            "a": create_source("a1", create_stream(1, 1, 2), []),
+            "b": create_source("b2", create_stream(20, 3), []),
+        },
+        str(output),
+    )
+
+    assert changes.rows_written == 3
+    assert read_amounts(output) == [1, 1, 20]
+
+
+def test_update__when_nothing_changes__does_not_load_streams(tmp_path):
+    output = tmp_path / "output.csv"
+    state = tmp_path / "state"
+    forecast = IncrementalForecast(str(state))
+    sources = {"a": create_source("a1", create_stream(1, 1, 2), [])}
+    forecast.update(sources, str(output))
+    for stream in (state / "streams").iterdir():
+        stream.unlink()
+
+    changes = forecast.update(sources, str(output))
+
+    assert changes.rewritten_from is None
+    assert changes.balance == 2
+
+
+def test_update__when_changed_repeatedly__matches_fresh_output(tmp_path):
+    output = tmp_path / "output.csv"
+    forecast = IncrementalForecast(str(tmp_path / "state"))
+    runs = [
+        {"a": ("a1", create_stream(1, 1, 3, 5, 7)), "b": ("b1", create_stream(10, 2))},
+        {"a": ("a1", create_stream(1, 1, 3, 5, 7)), "b": ("b2", create_stream(20, 6))},
+        {"a": ("a2", create_stream(2, 4, 5)), "b": ("b2", create_stream(20, 6))},
+    ]
+    for run in runs:
+        forecast.update(
+            {k: create_source(d, s, []) for k, (d, s) in run.items()}, str(output)
+        )
+
+    fresh = tmp_path / "fresh.csv"
+    IncrementalForecast(str(tmp_path / "fresh")).update(
+        {k: create_source(d, s, []) for k, (d, s) in runs[-1].items()}, str(fresh)
+    )
+    assert output.read_bytes() == fresh.read_bytes()
@@ -0,0 +1,94 @@
+import datetime
+
+from budgetter.account import Account
+from budgetter.budget import Budget
+from budgetter.ledger import Ledger
+
+
+def create_account():
+    account = Account(name="checking")
+    for day, amount, source in [(1, 100, "Me"), (2, -30, "Store"), (5, 10, "Me")]:
+        account.submit_transaction(
+            source, amount, "test", datetime.datetime(2025, 1, day)
+        )
+    return account
+
+
+def test_ledger__when_account_saved__loads_date_range(tmp_path):
+    with Ledger(str(tmp_path / "ledger.db")) as ledger:
+        ledger.save_account(create_account())
+
+        account = ledger.load_account(
+            "checking", datetime.date(2025, 1, 2), datetime.date(2025, 1, 5)
+        )
+
+    assert [t.amount for t in account.transactions] == [-30, 10]
+    assert account.transactions[0].when == datetime.datetime(2025, 1, 2)
+
+
+def test_ledger__running_balances__include_earlier_activity(tmp_path):
+    with Ledger(str(tmp_path / "ledger.db")) as ledger:
+        ledger.save_account(create_account())
+
+        balances = list(
+            ledger.running_balances("checking", start=datetime.date(2025, 1, 2))
+        )
+        on_day = ledger.balance_on_day("checking", datetime.date(2025, 1, 3))
+
+    assert [b for _, b in balances] == [70, 80]
+    assert on_day == 70
+
+
+def test_ledger__transactions_with__filters_by_counterparty(tmp_path):
+    with Ledger(str(tmp_path / "ledger.db")) as ledger:
+        ledger.save_account(create_account())
+
+        amounts = [t.amount for t in ledger.transactions_with("checking", "Me")]
+
+    assert amounts == [100, 10]
+
+
+def test_ledger__when_budget_saved__round_trips_schedules(tmp_path):
+    budget = Budget()
+    checking = create_account()
+    loan = Account(name="loan")
+    budget.add_account(checking)
+    budget.add_account(loan)
+    budget.add_payment_schedule(
+        "rent", checking, "monthly", -50, datetime.date(2025, 1, 3)
+    )
+    budget.add_transfer_schedule(
+        checking, loan, "monthly", "loan", 20, datetime.date(2025, 1, 4)
+    )
+    end = datetime.datetime(2025, 6, 1)
+
+    with Ledger(str(tmp_path / "ledger.db")) as ledger:
+        ledger.save_budget(budget)
+        loaded = ledger.load_budget()
+
+    expected = budget.forecast_accounts(end)
+    actual = loaded.forecast_accounts(end)
+    assert actual["checking"].balances == expected["checking"].balances
+    assert actual["loan"].balances == expected["loan"].balances
+
+
+def test_ledger__when_account_dropped_from_budget__removes_its_rows(tmp_path):
+    budget = Budget()
+    checking = create_account()
+    loan = Account(name="loan")
+    loan.submit_transaction("Me", -100, "initial deposit")
+    budget.add_account(checking)
+    budget.add_account(loan)
+
+    with Ledger(str(tmp_path / "ledger.db")) as ledger:
+        ledger.save_budget(budget)
+        ledger.save_forecasts([checking, loan])
+        del budget.accounts["loan"]
+        ledger.save_budget(budget)
+
+        names = ledger.account_names()
+        forecast = list(ledger.transactions("loan", forecast=True))
+        recorded = list(ledger.transactions("loan"))
+
+    assert names == ["checking"]
+    assert forecast == recorded == []
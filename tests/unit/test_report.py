@@ -0,0 +1,180 @@
+import datetime
+
+import pytest
+
+from budgetter.parse import Expense, Income
+from budgetter.report import (
+    Granularity,
+    category_lookup,
+    resample_balances,
+    summarize_forecast,
+)
+from budgetter.transaction import Transaction
+
+
+def create_transaction(amount: float, when: str):
+    return Transaction(
+        amount=amount,
+        description="test",
+        when=when,
+        from_="Me",
+        to_="checking",
+    )
+
+
+TRANSACTIONS = [
+    create_transaction(100, "2024-12-31"),
+    create_transaction(-50, "2025-01-02"),
+    create_transaction(200, "2025-01-02"),
+    create_transaction(-300, "2025-02-10"),
+    create_transaction(999, "2025-06-01"),
+]
+
+
+def test_resample_balances__when_day_has_no_activity__forward_fills():
+    periods = resample_balances(
+        TRANSACTIONS,
+        [Granularity.DAY],
+        datetime.date(2025, 1, 1),
+        datetime.date(2025, 1, 3),
+    )
+
+    days = periods[Granularity.DAY]
+    assert [d.date.day for d in days] == [1, 2, 3]
+    assert [d.close for d in days] == [100, 250, 250]
+    assert days[1].open == 100
+    assert days[1].min == 50
+    assert days[1].max == 250
+
+
+def test_resample_balances__when_given_many_granularities__aggregates_each():
+    periods = resample_balances(
+        TRANSACTIONS,
+        [Granularity.MONTH, Granularity.QUARTER],
+        datetime.date(2025, 1, 1),
+        datetime.date(2025, 3, 31),
+    )
+
+    months = periods[Granularity.MONTH]
+    assert [m.date.month for m in months] == [1, 2, 3]
+    assert [m.close for m in months] == [250, -50, -50]
+    [quarter] = periods[Granularity.QUARTER]
+    assert quarter.date == datetime.date(2025, 1, 1)
+    assert (quarter.open, quarter.close) == (100, -50)
+    assert (quarter.min, quarter.max) == (-50, 250)
+
+
+def test_granularity__week__starts_on_monday():
+    assert Granularity.WEEK.period_start(datetime.date(2025, 1, 2)) == (
+        datetime.date(2024, 12, 30)
+    )
+
+
+def test_summarize_forecast__when_downsampling__keeps_bucket_extremes():
+    transactions = [create_transaction(10, f"2025-01-{day:02}") for day in range(1, 31)]
+    transactions[14] = create_transaction(-500, "2025-01-15")
+
+    summary = summarize_forecast(
+        transactions,
+        4,
+        datetime.datetime(2025, 1, 1),
+        datetime.datetime(2025, 1, 31),
+    )
+
+    balances = [p.balance for p in summary.balances]
+    assert len(balances) <= 4
+    assert min(balances) == -360
+    whens = [p.when for p in summary.balances]
+    assert whens == sorted(whens)
+
+
+def test_summarize_forecast__when_given_categories__totals_per_period():
+    expense = Expense(
+        name="Netflix", monthly="$10.00", due_date="1/1/2025", expense_type="Fun"
+    )
+    categories = category_lookup([expense], [], [])
+    transactions = [
+        create_transaction(100, "2025-01-01"),
+        create_transaction(-10, "2025-01-05"),
+        create_transaction(-10, "2025-02-05"),
+    ]
+    for transaction in transactions[1:]:
+        transaction.description = "Scheduled Payment of Netflix for checking"
+
+    summary = summarize_forecast(
+        transactions,
+        10,
+        datetime.datetime(2025, 1, 1),
+        datetime.datetime(2025, 2, 28),
+        categories=categories,
+    )
+
+    assert summary.category_totals == {
+        datetime.date(2025, 1, 1): {"Uncategorized": 100, "Fun": -10},
+        datetime.date(2025, 2, 1): {"Fun": -10},
+    }
+
+
+def test_category_lookup__when_expense_and_income_share_name__keeps_both():
+    expense = Expense(
+        name="Insurance", monthly="$10.00", due_date="1/1/2025", expense_type="Bills"
+    )
+    income = Income(
+        name="Insurance", amount="$50.00", pay_date="1/1/2025", income_type="Salary"
+    )
+    categories = category_lookup([expense], [], [income])
+    description = "Scheduled Payment of Insurance for checking"
+    transactions = [
+        create_transaction(50, "2025-01-01"),
+        create_transaction(-10, "2025-01-02"),
+    ]
+    for transaction in transactions:
+        transaction.description = description
+
+    summary = summarize_forecast(
+        transactions,
+        10,
+        datetime.datetime(2025, 1, 1),
+        datetime.datetime(2025, 1, 31),
+        categories=categories,
+    )
+
+    assert summary.category_totals == {
+        datetime.date(2025, 1, 1): {"Salary": 50, "Bills": -10},
+    }
+
+
+def test_summarize_forecast__when_bucket_closes__keeps_final_balance():
+    transactions = [
+        create_transaction(100, "2025-01-01"),
+        create_transaction(50, "2025-01-02"),
+        create_transaction(-20, "2025-01-03"),
+    ]
+
+    summary = summarize_forecast(
+        transactions,
+        4,
+        datetime.datetime(2025, 1, 1),
+        datetime.datetime(2025, 1, 3),
+    )
+
+    assert [p.balance for p in summary.balances] == [100, 150, 130]
+    assert summary.balances[-1].balance == 130
+
+
+@pytest.mark.parametrize("points", [1, 2, 3, 4, 5, 9])
+def test_summarize_forecast__never_exceeds_points(points):
+    transactions = [
+        create_transaction(amount, f"2025-01-{day:02}")
+        for day, amount in enumerate([10, -30, 50, -70, 90, -5, 3, 1, -2, 8], 1)
+    ]
+
+    summary = summarize_forecast(
+        transactions,
+        points,
+        datetime.datetime(2025, 1, 1),
+        datetime.datetime(2025, 1, 10),
+    )
+
+    assert 1 <= len(summary.balances) <= points
+    assert summary.balances[-1].balance == sum(t.amount for t in transactions)